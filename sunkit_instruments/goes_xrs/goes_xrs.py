@@ -49,6 +49,7 @@ import csv
 import copy
 import socket
 import datetime
+import functools
 from itertools import dropwhile
 from urllib.parse import urljoin
 
@@ -449,6 +450,30 @@ def _goes_chianti_tem(
     return temp, em
 
 
+@functools.lru_cache()
+def _read_chianti_table(data_file, label):
+    """
+    Reads the log10 temperature column and the ``label`` column from one
+    of the GOES CHIANTI csv files.
+
+    The result is cached so that repeated calls do not re-read the file.
+    The returned arrays are read-only as they are shared between calls.
+    """
+    modeltemp = []
+    modelcol = []
+    with open(data_file) as csvfile:
+        startline = dropwhile(lambda line: line.startswith("#"), csvfile)
+        csvreader = csv.DictReader(startline, delimiter=";")
+        for row in csvreader:
+            modeltemp.append(float(row["log10temp_MK"]))
+            modelcol.append(float(row[label]))
+    modeltemp = np.asarray(modeltemp)
+    modelcol = np.asarray(modelcol)
+    modeltemp.flags.writeable = False
+    modelcol.flags.writeable = False
+    return modeltemp, modelcol
+
+
 @manager.require(
     "file_temp_cor",
     [urljoin(GOES_REMOTE_PATH, FILE_TEMP_COR)],
@@ -569,23 +594,13 @@ def _goes_get_chianti_temp(
             "abundances must be a string equalling " "'coronal' or 'photospheric'."
         )
 
-    # Initialize lists to hold model data of flux ratio - temperature
-    # relationship read in from csv file
-    modeltemp = []  # modelled temperature is in log_10 space in units of MK
-    modelratio = []
     # Determine name of column in csv file containing model ratio values
     # for relevant GOES satellite
     label = f"ratioGOES{satellite}"
     # Read data representing appropriate temperature--flux ratio
     # relationship depending on satellite number and assumed abundances.
-    with open(data_file) as csvfile:
-        startline = dropwhile(lambda l: l.startswith("#"), csvfile)
-        csvreader = csv.DictReader(startline, delimiter=";")
-        for row in csvreader:
-            modeltemp.append(float(row["log10temp_MK"]))
-            modelratio.append(float(row[label]))
-    modeltemp = np.asarray(modeltemp)
-    modelratio = np.asarray(modelratio)
+    # modelled temperature is in log_10 space in units of MK
+    modeltemp, modelratio = _read_chianti_table(data_file, label)
 
     # Ensure input values of flux ratio are within limits of model table
     if np.min(fluxratio) < np.min(modelratio) or np.max(fluxratio) > np.max(modelratio):
@@ -741,24 +756,14 @@ def _goes_get_chianti_em(
     if len(longflux) != len(temp):
         raise ValueError("longflux and temp must have same number of " "elements.")
 
-    # Initialize lists to hold model data of temperature - long channel
-    # flux relationship read in from csv file.
-    modeltemp = []  # modelled temperature is in log_10 space in units of MK
-    modelflux = []
     # Determine name of column in csv file containing model ratio values
     # for relevant GOES satellite
     label = f"longfluxGOES{satellite}"
 
     # Read data representing appropriate temperature--long flux
     # relationship depending on satellite number and assumed abundances.
-    with open(data_file) as csvfile:
-        startline = dropwhile(lambda l: l.startswith("#"), csvfile)
-        csvreader = csv.DictReader(startline, delimiter=";")
-        for row in csvreader:
-            modeltemp.append(float(row["log10temp_MK"]))
-            modelflux.append(float(row[label]))
-    modeltemp = np.asarray(modeltemp)
-    modelflux = np.asarray(modelflux)
+    # modelled temperature is in log_10 space in units of MK
+    modeltemp, modelflux = _read_chianti_table(data_file, label)
 
     # Ensure input values of flux ratio are within limits of model table
     if (
@@ -1344,12 +1349,15 @@ def flux_to_flareclass(goesflux: u.watt / u.m**2):
     ----------
     flux : `~astropy.units.Quantity`
         X-ray flux between 1 and 8 Angstroms (usually measured by GOES) as
-        measured at the Earth in W/m^2
+        measured at the Earth in W/m^2. Can be a scalar or an array.
 
     Returns
     -------
-    flareclass : str
+    flareclass : str or `numpy.ndarray`
         The flare class e.g.: 'X3.2', 'M1.5', 'A9.6'.
+        If ``flux`` is an array, an array of flare classes of the same shape
+        is returned. Non-finite fluxes (e.g. NaN data gaps) give an empty
+        string.
 
     Raises
     ------
@@ -1363,6 +1371,7 @@ def flux_to_flareclass(goesflux: u.watt / u.m**2):
     Examples
     --------
     >>> from sunkit_instruments.goes_xrs import flux_to_flareclass
+    >>> import numpy as np
     >>> import astropy.units as u
     >>> flux_to_flareclass(1e-08 * u.watt/u.m**2)
     'A1'
@@ -1374,24 +1383,29 @@ def flux_to_flareclass(goesflux: u.watt / u.m**2):
     'A0.78'
     >>> flux_to_flareclass(0.00682 * u.watt/u.m**2)
     'X68.2'
+    >>> flux_to_flareclass([1e-08, 4.7e-06, np.nan] * u.watt/u.m**2)
+    array(['A1', 'C4.7', ''], dtype='<U4')
     """
-
-    if goesflux.value < 0:
+    flux = np.asanyarray(goesflux.to_value("W/m**2"))
+    if np.any(flux < 0):
         raise ValueError("Flux cannot be negative")
 
-    decade = np.floor(np.log10(goesflux.to("W/m**2").value))
-    # invert the conversion dictionary
-    conversion_dict = {v: k for k, v in GOES_CONVERSION_DICT.items()}
-    if decade < -8:
-        str_class = "A"
-        decade = -8
-    elif decade > -4:
-        str_class = "X"
-        decade = -4
-    else:
-        str_class = conversion_dict.get(u.Quantity(10**decade, "W/m**2"))
-    goes_subclass = 10**-decade * goesflux.to("W/m**2").value
-    return f"{str_class}{goes_subclass:.3g}"
+    # Non-finite fluxes, e.g. data gaps, have no flare class.
+    finite = np.isfinite(flux)
+    # Class letters ordered by increasing flux, i.e. A, B, C, M, X.
+    letters = np.array(
+        sorted(GOES_CONVERSION_DICT, key=lambda k: GOES_CONVERSION_DICT[k])
+    )
+    # Fluxes below A1 are still A class and fluxes above X10 are still X class.
+    with np.errstate(divide="ignore"):
+        decade = np.clip(np.floor(np.log10(flux)), -8, -4)
+    decade = np.where(finite, decade, -8)
+    str_class = letters[(decade + 8).astype(int)]
+    goes_subclass = np.char.mod(np.full(flux.shape, "%.3g"), 10**-decade * flux)
+    flareclass = np.where(finite, np.char.add(str_class, goes_subclass), "")
+    if flareclass.ndim == 0:
+        return str(flareclass)
+    return flareclass
 
 
 def _assert_chrono_order(obstime):
@@ -20,6 +20,18 @@ from sunkit_instruments.data.test import get_test_filepath
 LONGFLUX = Quantity([7e-6], unit="W/m**2")
 SHORTFLUX = Quantity([7e-7], unit="W/m**2")
 DATE = "2014-04-16"
+# Define input variables to be used in test functions for
+# _calc_rad_loss and _goes_lx.
+LONGFLUX_6 = Quantity(np.full(6, 7e-6), unit="W/m**2")
+SHORTFLUX_6 = Quantity(np.full(6, 7e-7), unit="W/m**2")
+TEMP_6 = Quantity(np.full(6, 11.0), unit="MK")
+EM_6 = Quantity(np.full(6, 4.0e48), unit="1/cm**3")
+OBSTIME = np.array(
+    [parse_time((2014, 1, 1, 0, 0, s)) for s in range(0, 12, 2)], dtype=object
+)
+OBSTIME_TOOLONG = np.array(
+    [parse_time((2014, 1, 1, 0, 0, s)) for s in range(0, 14, 2)], dtype=object
+)
 
 
 @pytest.mark.remote_data
@@ -65,11 +77,18 @@ def test_goes_event_list():
     assert result[0]["noaa_active_region"] == 11226
 
 
-@pytest.fixture
-def goeslc():
+@pytest.fixture(scope="session")
+def _goeslc_raw():
+    # Parse the FITS file only once per test session.
     return timeseries.TimeSeries(get_test_filepath("go1520110607.fits"))
 
 
+@pytest.fixture
+def goeslc(_goeslc_raw):
+    # Return a copy so that tests which modify the TimeSeries stay isolated.
+    return copy.deepcopy(_goeslc_raw)
+
+
 @pytest.mark.remote_data
 def test_calculate_temperature_em(goeslc):
     # Create XRSTimeSeries object, then create new one with
@@ -141,110 +160,36 @@ def test_goes_chianti_tem_errors():
 
 
 @pytest.mark.remote_data
-def test_goes_chianti_tem_case1():
-    # test case 1: satellite > 7, abundances = coronal
-    temp1, em1 = goes._goes_chianti_tem(LONGFLUX, SHORTFLUX, satellite=15, date=DATE)
-    np.testing.assert_allclose(temp1, Quantity([11.28], unit="MK"), rtol=0.01)
-    assert all(em1 < Quantity([4.79e48], unit="1/cm**3")) and em1 > Quantity(
-        [4.78e48], unit="1/cm**3"
-    )
-
-
-@pytest.mark.remote_data
-def test_goes_chianti_tem_case2():
-    # test case 2: satellite > 7, abundances = photospheric
-    temp2, em2 = goes._goes_chianti_tem(
-        LONGFLUX, SHORTFLUX, satellite=15, date=DATE, abundances="photospheric"
-    )
-    assert all(temp2 < Quantity([10.25], unit="MK")) and all(
-        temp2 > Quantity([10.24], unit="MK")
-    )
-    assert all(em2 < Quantity([1.12e49], unit="1/cm**3")) and all(
-        em2 > Quantity([1.11e49], unit="1/cm**3")
-    )
-
-
-@pytest.mark.remote_data
-def test_goes_chianti_tem_case3():
-    # test case 3: satellite < 8 and != 6, abundances = coronal
-    temp3, em3 = goes._goes_chianti_tem(
-        LONGFLUX, SHORTFLUX, satellite=5, date=DATE, abundances="coronal"
-    )
-    assert all(temp3 < Quantity([11.43], unit="MK")) and all(
-        temp3 > Quantity([11.42], unit="MK")
-    )
-    assert all(em3 < Quantity([3.85e48], unit="1/cm**3")) and all(
-        em3 > Quantity([3.84e48], unit="1/cm**3")
-    )
-
-
-@pytest.mark.remote_data
-def test_goes_chianti_tem_case4():
-    # test case 4: satellite < 8 and != 6, abundances = photospheric
-    temp4, em4 = goes._goes_chianti_tem(
-        LONGFLUX, SHORTFLUX, satellite=5, date=DATE, abundances="photospheric"
-    )
-    assert all(temp4 < Quantity([10.42], unit="MK")) and all(
-        temp4 > Quantity([10.41], unit="MK")
-    )
-    assert all(em4 < Quantity(8.81e48, unit="1/cm**3")) and all(
-        em4 > Quantity(8.80e48, unit="1/cm**3")
-    )
-
-
-@pytest.mark.remote_data
-def test_goes_chianti_tem_case5():
-    # test case 5: satellite = 6, date < 1983-06-28, abundances = coronal
-    temp5, em5 = goes._goes_chianti_tem(
-        LONGFLUX, SHORTFLUX, satellite=6, date="1983-06-27", abundances="coronal"
-    )
-    assert all(temp5 < Quantity(12.30, unit="MK")) and all(
-        temp5 > Quantity(12.29, unit="MK")
-    )
-    assert all(em5 < Quantity(3.13e48, unit="1/cm**3")) and all(
-        em5 > Quantity(3.12e48, unit="1/cm**3")
-    )
-
-
-@pytest.mark.remote_data
-def test_goes_chianti_tem_case6():
-    # test case 6: satellite = 6, date < 1983-06-28, abundances = photospheric
-    temp6, em6 = goes._goes_chianti_tem(
-        LONGFLUX, SHORTFLUX, satellite=6, date="1983-06-27", abundances="photospheric"
-    )
-    assert all(temp6 < Quantity(11.44, unit="MK")) and all(
-        temp6 > Quantity(11.43, unit="MK")
-    )
-    assert all(em6 < Quantity(6.74e48, unit="1/cm**3")) and all(
-        em6 > Quantity(6.73e48, unit="1/cm**3")
-    )
-
-
-@pytest.mark.remote_data
-def test_goes_chianti_tem_case7():
-    # test case 7: satellite = 6, date > 1983-06-28, abundances = coronal
-    temp7, em7 = goes._goes_chianti_tem(
-        LONGFLUX, SHORTFLUX, satellite=6, date=DATE, abundances="coronal"
-    )
-    assert all(temp7 < Quantity(11.34, unit="MK")) and all(
-        temp7 > Quantity(11.33, unit="MK")
-    )
-    assert all(em7 < Quantity(4.08e48, unit="1/cm**3")) and all(
-        em7 > Quantity(4.07e48, unit="1/cm**3")
-    )
-
-
-@pytest.mark.remote_data
-def test_goes_chianti_tem_case8():
-    # test case 8: satellite = 6, date > 1983-06-28, abundances = photospheric
-    temp8, em8 = goes._goes_chianti_tem(
-        LONGFLUX, SHORTFLUX, satellite=6, date=DATE, abundances="photospheric"
+@pytest.mark.parametrize(
+    "satellite, date, abundances, temp_range, em_range",
+    [
+        # satellite > 7, abundances = coronal
+        (15, DATE, "coronal", (11.1672, 11.3928), (4.78e48, 4.79e48)),
+        # satellite > 7, abundances = photospheric
+        (15, DATE, "photospheric", (10.24, 10.25), (1.11e49, 1.12e49)),
+        # satellite < 8 and != 6, abundances = coronal
+        (5, DATE, "coronal", (11.42, 11.43), (3.84e48, 3.85e48)),
+        # satellite < 8 and != 6, abundances = photospheric
+        (5, DATE, "photospheric", (10.41, 10.42), (8.80e48, 8.81e48)),
+        # satellite = 6, date < 1983-06-28, abundances = coronal
+        (6, "1983-06-27", "coronal", (12.29, 12.30), (3.12e48, 3.13e48)),
+        # satellite = 6, date < 1983-06-28, abundances = photospheric
+        (6, "1983-06-27", "photospheric", (11.43, 11.44), (6.73e48, 6.74e48)),
+        # satellite = 6, date > 1983-06-28, abundances = coronal
+        (6, DATE, "coronal", (11.33, 11.34), (4.07e48, 4.08e48)),
+        # satellite = 6, date > 1983-06-28, abundances = photospheric
+        (6, DATE, "photospheric", (10.35, 10.36), (9.38e48, 9.39e48)),
+    ],
+)
+def test_goes_chianti_tem_case(satellite, date, abundances, temp_range, em_range):
+    temp, em = goes._goes_chianti_tem(
+        LONGFLUX, SHORTFLUX, satellite=satellite, date=date, abundances=abundances
     )
-    assert all(temp8 < Quantity(10.36, unit="MK")) and all(
-        temp8 > Quantity(10.35, unit="MK")
+    assert all(temp > Quantity(temp_range[0], unit="MK")) and all(
+        temp < Quantity(temp_range[1], unit="MK")
     )
-    assert all(em8 < Quantity(9.39e48, unit="1/cm**3")) and all(
-        em8 > Quantity(9.38e48, unit="1/cm**3")
+    assert all(em > Quantity(em_range[0], unit="1/cm**3")) and all(
+        em < Quantity(em_range[1], unit="1/cm**3")
     )
 
 
@@ -280,58 +225,30 @@ def test_calculate_radiative_loss_rate(goeslc):
 @pytest.mark.remote_data
 def test_calc_rad_loss_errors():
     # Define input variables
-    temp = 11.0 * Quantity(np.ones(6), unit="MK")
-    em = 4.0e48 * Quantity(np.ones(6), unit="1/cm**3")
-    obstime = np.array(
-        [
-            parse_time((2014, 1, 1, 0, 0, 0)),
-            parse_time((2014, 1, 1, 0, 0, 2)),
-            parse_time((2014, 1, 1, 0, 0, 4)),
-            parse_time((2014, 1, 1, 0, 0, 6)),
-            parse_time((2014, 1, 1, 0, 0, 8)),
-            parse_time((2014, 1, 1, 0, 0, 10)),
-        ],
-        dtype=object,
-    )
-    temp_toolong = Quantity(np.append(temp.value, 0), unit="MK")
-    obstime_toolong = np.array(
-        [
-            parse_time((2014, 1, 1, 0, 0, 0)),
-            parse_time((2014, 1, 1, 0, 0, 2)),
-            parse_time((2014, 1, 1, 0, 0, 4)),
-            parse_time((2014, 1, 1, 0, 0, 6)),
-            parse_time((2014, 1, 1, 0, 0, 8)),
-            parse_time((2014, 1, 1, 0, 0, 10)),
-            parse_time((2014, 1, 1, 0, 0, 12)),
-        ],
-        dtype=object,
-    )
-    obstime_nonchrono = copy.deepcopy(obstime)
-    obstime_nonchrono[1] = obstime[-1]
-    obstime_nonchrono[-1] = obstime[1]
-    obstime_notdatetime = copy.deepcopy(obstime)
+    temp_toolong = Quantity(np.append(TEMP_6.value, 0), unit="MK")
+    obstime_nonchrono = copy.deepcopy(OBSTIME)
+    obstime_nonchrono[1] = OBSTIME[-1]
+    obstime_nonchrono[-1] = OBSTIME[1]
+    obstime_notdatetime = copy.deepcopy(OBSTIME)
     obstime_notdatetime[0] = 1
     temp_outofrange = Quantity([101, 11.0, 11.0, 11.0, 11.0, 11.0], unit="MK")
     # Ensure correct exceptions are raised.
     with pytest.raises(ValueError):
-        goes._calc_rad_loss(temp_toolong, em, obstime)
+        goes._calc_rad_loss(temp_toolong, EM_6, OBSTIME)
     with pytest.raises(ValueError):
-        goes._calc_rad_loss(temp_outofrange, em, obstime)
+        goes._calc_rad_loss(temp_outofrange, EM_6, OBSTIME)
     with pytest.raises(IOError):
-        goes._calc_rad_loss(temp, em, obstime_toolong)
+        goes._calc_rad_loss(TEMP_6, EM_6, OBSTIME_TOOLONG)
     with pytest.raises(ValueError):
-        goes._calc_rad_loss(temp, em, obstime_notdatetime)
+        goes._calc_rad_loss(TEMP_6, EM_6, obstime_notdatetime)
     with pytest.raises(ValueError):
-        goes._calc_rad_loss(temp, em, obstime_nonchrono)
+        goes._calc_rad_loss(TEMP_6, EM_6, obstime_nonchrono)
 
 
 @pytest.mark.remote_data
 def test_calc_rad_loss_nokwags():
-    # Define input variables
-    temp = Quantity([11.0, 11.0, 11.0, 11.0, 11.0, 11.0], unit="MK")
-    em = Quantity([4.0e48, 4.0e48, 4.0e48, 4.0e48, 4.0e48, 4.0e48], unit="1/cm**3")
     # Test output is correct when no kwags are set.
-    rad_loss_test = goes._calc_rad_loss(temp[:2], em[:2])
+    rad_loss_test = goes._calc_rad_loss(TEMP_6[:2], EM_6[:2])
     rad_loss_expected = {
         "rad_loss_rate": 3.01851392e19 * Quantity(np.ones(2), unit="J/s")
     }
@@ -343,22 +260,8 @@ def test_calc_rad_loss_nokwags():
 
 @pytest.mark.remote_data
 def test_calc_rad_loss_obstime():
-    # Define input variables
-    temp = Quantity([11.0, 11.0, 11.0, 11.0, 11.0, 11.0], unit="MK")
-    em = Quantity([4.0e48, 4.0e48, 4.0e48, 4.0e48, 4.0e48, 4.0e48], unit="1/cm**3")
-    obstime = np.array(
-        [
-            parse_time((2014, 1, 1, 0, 0, 0)),
-            parse_time((2014, 1, 1, 0, 0, 2)),
-            parse_time((2014, 1, 1, 0, 0, 4)),
-            parse_time((2014, 1, 1, 0, 0, 6)),
-            parse_time((2014, 1, 1, 0, 0, 8)),
-            parse_time((2014, 1, 1, 0, 0, 10)),
-        ],
-        dtype=object,
-    )
     # Test output is correct when obstime and cumulative kwargs are set.
-    rad_loss_test = goes._calc_rad_loss(temp, em, obstime)
+    rad_loss_test = goes._calc_rad_loss(TEMP_6, EM_6, OBSTIME)
     rad_loss_expected = {
         "rad_loss_rate": 3.01851392e19 * Quantity(np.ones(6), unit="J/s"),
         "rad_loss_int": Quantity(3.01851392e20, unit="J"),
@@ -401,39 +304,23 @@ def test_calculate_xray_luminosity(goeslc):
 
 def test_goes_lx_errors():
     # Define input values of flux and time.
-    longflux = 7e-6 * Quantity(np.ones(6), unit="W/m**2")
-    shortflux = 7e-7 * Quantity(np.ones(6), unit="W/m**2")
-    obstime = np.array(
-        [
-            parse_time((2014, 1, 1, 0, 0, 0)),
-            parse_time((2014, 1, 1, 0, 0, 2)),
-            parse_time((2014, 1, 1, 0, 0, 4)),
-            parse_time((2014, 1, 1, 0, 0, 6)),
-            parse_time((2014, 1, 1, 0, 0, 8)),
-            parse_time((2014, 1, 1, 0, 0, 10)),
-        ],
-        dtype=object,
-    )
-    longflux_toolong = Quantity(np.append(longflux.value, 0), unit=longflux.unit)
-    obstime_nonchrono = copy.deepcopy(obstime)
-    obstime_nonchrono[1] = obstime[-1]
-    obstime_notdatetime = copy.deepcopy(obstime)
+    longflux_toolong = Quantity(np.append(LONGFLUX_6.value, 0), unit=LONGFLUX_6.unit)
+    obstime_nonchrono = copy.deepcopy(OBSTIME)
+    obstime_nonchrono[1] = OBSTIME[-1]
+    obstime_notdatetime = copy.deepcopy(OBSTIME)
     obstime_notdatetime[0] = 1
     # Ensure correct exceptions are raised.
     with pytest.raises(ValueError):
-        goes._goes_lx(longflux_toolong, shortflux, obstime)
+        goes._goes_lx(longflux_toolong, SHORTFLUX_6, OBSTIME)
     with pytest.raises(ValueError):
-        goes._goes_lx(longflux, shortflux, obstime_notdatetime)
+        goes._goes_lx(LONGFLUX_6, SHORTFLUX_6, obstime_notdatetime)
     with pytest.raises(ValueError):
-        goes._goes_lx(longflux, shortflux, obstime_nonchrono)
+        goes._goes_lx(LONGFLUX_6, SHORTFLUX_6, obstime_nonchrono)
 
 
 def test_goes_lx_nokwargs():
-    # Define input values of flux and time.
-    longflux = Quantity([7e-6, 7e-6, 7e-6, 7e-6, 7e-6, 7e-6], unit="W/m**2")
-    shortflux = Quantity([7e-7, 7e-7, 7e-7, 7e-7, 7e-7, 7e-7], unit="W/m**2")
     # Test output when no kwargs are set.
-    lx_test = goes._goes_lx(longflux[:2], shortflux[:2])
+    lx_test = goes._goes_lx(LONGFLUX_6[:2], SHORTFLUX_6[:2])
     lx_expected = {
         "longlum": Quantity([1.98649103e18, 1.98649103e18], unit="W"),
         "shortlum": Quantity([1.98649103e17, 1.98649103e17], unit="W"),
@@ -444,11 +331,8 @@ def test_goes_lx_nokwargs():
 
 
 def test_goes_lx_date():
-    # Define input values of flux and time.
-    longflux = Quantity([7e-6, 7e-6, 7e-6, 7e-6, 7e-6, 7e-6], unit="W/m**2")
-    shortflux = Quantity([7e-7, 7e-7, 7e-7, 7e-7, 7e-7, 7e-7], unit="W/m**2")
     # Test output when date kwarg is set.
-    lx_test = goes._goes_lx(longflux[:2], shortflux[:2], date="2014-04-21")
+    lx_test = goes._goes_lx(LONGFLUX_6[:2], SHORTFLUX_6[:2], date="2014-04-21")
     lx_expected = {
         "longlum": Quantity([1.98649103e18, 1.98649103e18], unit="W"),
         "shortlum": Quantity([1.98649103e17, 1.98649103e17], unit="W"),
@@ -459,22 +343,8 @@ def test_goes_lx_date():
 
 
 def test_goes_lx_obstime():
-    # Define input values of flux and time.
-    longflux = Quantity([7e-6, 7e-6, 7e-6, 7e-6, 7e-6, 7e-6], unit="W/m**2")
-    shortflux = Quantity([7e-7, 7e-7, 7e-7, 7e-7, 7e-7, 7e-7], unit="W/m**2")
-    obstime = np.array(
-        [
-            parse_time((2014, 1, 1, 0, 0, 0)),
-            parse_time((2014, 1, 1, 0, 0, 2)),
-            parse_time((2014, 1, 1, 0, 0, 4)),
-            parse_time((2014, 1, 1, 0, 0, 6)),
-            parse_time((2014, 1, 1, 0, 0, 8)),
-            parse_time((2014, 1, 1, 0, 0, 10)),
-        ],
-        dtype=object,
-    )
     # Test output when obstime and cumulative kwargs are set.
-    lx_test = goes._goes_lx(longflux, shortflux, obstime)
+    lx_test = goes._goes_lx(LONGFLUX_6, SHORTFLUX_6, OBSTIME)
     lx_expected = {
         "longlum": 1.96860565e18 * Quantity(np.ones(6), unit="W"),
         "shortlum": 1.96860565e17 * Quantity(np.ones(6), unit="W"),
@@ -512,8 +382,9 @@ def test_flux_to_classletter():
     """
     fluxes = Quantity(10 ** (-np.arange(9, 2.0, -1)), "W/m**2")
     classesletter = ["A", "A", "B", "C", "M", "X", "X"]
-    calculated_classesletter = [goes.flux_to_flareclass(f)[0] for f in fluxes]
-    calculated_classnumber = [float(goes.flux_to_flareclass(f)[1:]) for f in fluxes]
+    calculated_classes = goes.flux_to_flareclass(fluxes)
+    calculated_classesletter = [c[0] for c in calculated_classes]
+    calculated_classnumber = [float(c[1:]) for c in calculated_classes]
     assert_array_equal(classesletter, calculated_classesletter)
     assert_array_equal([0.1, 1, 1, 1, 1, 1, 10], calculated_classnumber)
     # now test the Examples
@@ -524,6 +395,24 @@ def test_flux_to_classletter():
     assert goes.flux_to_flareclass(4.7e-06 * u.watt / u.m**2) == "C4.7"
     assert goes.flux_to_flareclass(6.9e-07 * u.watt / u.m**2) == "B6.9"
     assert goes.flux_to_flareclass(2.1e-05 * u.watt / u.m**2) == "M2.1"
+    with pytest.raises(ValueError):
+        goes.flux_to_flareclass(Quantity([1e-6, -1e-6], "W/m**2"))
+    # scalar input gives a str and array input keeps its shape
+    assert isinstance(goes.flux_to_flareclass(1e-6 * u.W / u.m**2), str)
+    classes_2d = goes.flux_to_flareclass(
+        Quantity([[1e-6, 2e-5], [3e-4, 4e-8]], "W/m**2")
+    )
+    assert classes_2d.shape == (2, 2)
+    assert_array_equal(classes_2d, [["C1", "M2"], ["X3", "A4"]])
+    classes_empty = goes.flux_to_flareclass(Quantity([], "W/m**2"))
+    assert classes_empty.shape == (0,)
+    assert classes_empty.dtype.kind == "U"
+    # non-finite fluxes (e.g. data gaps) give an empty class
+    assert_array_equal(
+        goes.flux_to_flareclass(Quantity([1e-6, np.nan, np.inf], "W/m**2")),
+        ["C1", "", ""],
+    )
+    assert goes.flux_to_flareclass(np.nan * u.W / u.m**2) == ""
 
 
 def test_class_to_flux():